@@ -12,8 +12,33 @@ import re
 import urllib.request
 import urllib.error
 import logging
+import subprocess
+import threading
+import concurrent.futures
 from datetime import datetime
 from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+from array import array
+
+# Optional accelerator: when NumPy and Numba are installed, the per-SCC
+# cycle search runs as LLVM-compiled code over CSR adjacency arrays.
+# Both are optional so the script keeps working with only the standard
+# library, falling back to the pure-Python search.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
+
+# Optional accelerator: C extension built from _cycle.pyx (see
+# setup.py). Takes precedence over the Numba path when both are
+# present.
+try:
+    from _cycle import longest_cycle as _c_longest_cycle
+except ImportError:
+    _c_longest_cycle = None
 
 
 # Global variables for run tracking
@@ -120,38 +145,34 @@ result:
     return solution_path, metadata_path
 
 
+# Matches every Google Drive URL flavor in one pass; compiled once at
+# module load instead of looping three patterns through the re cache
+_DRIVE_ID_RE = re.compile(r'(?:/file/d/|id=|/d/)([a-zA-Z0-9_-]+)')
+
+
 def extract_google_drive_id(url):
     """Extract file ID from Google Drive URL."""
-    patterns = [
-        r'/file/d/([a-zA-Z0-9_-]+)',
-        r'id=([a-zA-Z0-9_-]+)',
-        r'/d/([a-zA-Z0-9_-]+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = _DRIVE_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
-def download_file(url, dest_folder="data"):
+def open_download_stream(url):
     """
-    Download file from URL (supports Google Drive links).
-    Returns the path to the downloaded file.
+    Resolve the URL (supports Google Drive links) and open the HTTP
+    response for streaming.
+    Returns (response, filename); the body is consumed through
+    iter_download_chunks so the data can flow straight into the parser
+    without a disk round-trip.
     """
     global LOGGER
-    
-    # Create destination folder if it doesn't exist
-    os.makedirs(dest_folder, exist_ok=True)
-    LOGGER.debug(f"Destination folder created/verified: {dest_folder}")
-    
+
     # Check if it's a Google Drive URL
     if "drive.google.com" in url:
         file_id = extract_google_drive_id(url)
         if not file_id:
             LOGGER.error("Could not extract file ID from Google Drive URL")
             raise ValueError("Could not extract file ID from Google Drive URL")
-        
+
         # Use the drive.usercontent.google.com endpoint for large files
         download_url = f"https://drive.usercontent.google.com/download?id={file_id}&export=download&confirm=t"
         filename = "large_input_v1.txt"
@@ -159,12 +180,9 @@ def download_file(url, dest_folder="data"):
     else:
         download_url = url
         filename = os.path.basename(url.split('?')[0]) or "downloaded_data.txt"
-    
-    dest_path = os.path.join(dest_folder, filename)
-    
+
     LOGGER.info(f"Downloading from: {download_url}")
-    LOGGER.info(f"Saving to: {dest_path}")
-    
+
     try:
         # Create request with headers
         headers = {
@@ -172,169 +190,760 @@ def download_file(url, dest_folder="data"):
         }
         request = urllib.request.Request(download_url, headers=headers)
         LOGGER.debug("HTTP request created with custom headers")
-        
-        with urllib.request.urlopen(request, timeout=300) as response:
-            total_size = response.headers.get('Content-Length')
-            if total_size:
-                total_size = int(total_size)
-                LOGGER.info(f"File size: {total_size / (1024*1024):.2f} MB")
-            
-            # Download with progress indicator
-            downloaded = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
-            last_log_percent = 0
-            
-            with open(dest_path, 'wb') as out_file:
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    out_file.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size:
-                        progress = (downloaded / total_size) * 100
-                        print(f"\rProgress: {progress:.1f}% ({downloaded / (1024*1024):.2f} MB)", end='', flush=True)
-                        # Log every 10%
-                        if int(progress / 10) > last_log_percent:
-                            last_log_percent = int(progress / 10)
-                            LOGGER.debug(f"Download progress: {progress:.1f}%")
-                    else:
-                        print(f"\rDownloaded: {downloaded / (1024*1024):.2f} MB", end='', flush=True)
-            
-            print()  # New line after progress
-        
-        # Verify file was downloaded
-        if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
-            file_size = os.path.getsize(dest_path)
-            LOGGER.info(f"Download complete! File size: {file_size / (1024*1024):.2f} MB")
-            
-            # Quick validation - check if it's HTML (error page)
-            with open(dest_path, 'r', encoding='utf-8', errors='ignore') as f:
-                first_line = f.readline()
-                if first_line.strip().startswith('<!DOCTYPE html>') or first_line.strip().startswith('<html'):
-                    LOGGER.error("Download failed - received HTML page instead of data file")
-                    raise RuntimeError("Download failed - received HTML page instead of data file")
-            
-            LOGGER.debug("File validation passed - not an HTML error page")
-            return dest_path, filename
-        else:
-            LOGGER.error("Download failed - file is empty or doesn't exist")
-            raise RuntimeError("Download failed - file is empty or doesn't exist")
-            
+
+        response = urllib.request.urlopen(request, timeout=300)
     except urllib.error.URLError as e:
         LOGGER.error(f"Failed to download file: {e}")
         raise RuntimeError(f"Failed to download file: {e}")
 
+    total_size = response.headers.get('Content-Length')
+    if total_size:
+        LOGGER.info(f"File size: {int(total_size) / (1024*1024):.2f} MB")
+
+    return response, filename
 
-def find_longest_cycle_in_graph(graph):
+
+def iter_download_chunks(response, cache_path=None):
     """
-    Find the longest simple cycle in a directed graph using DFS.
-    Returns the length of the longest cycle found.
+    Yield the HTTP response body in 1 MB chunks, with the same progress
+    reporting the old disk-based download produced.
+    When cache_path is given, every chunk is also written there so a
+    copy still lands on disk (for --skip-download reuse) without a
+    second read pass. The first chunk is checked for an HTML error
+    page, which is how Google Drive reports failures.
     """
-    if not graph:
-        return 0
-    
-    nodes = set(graph.keys())
-    for destinations in graph.values():
-        nodes.update(destinations)
-    
+    global LOGGER
+
+    total_size = response.headers.get('Content-Length')
+    total_size = int(total_size) if total_size else None
+
+    downloaded = 0
+    chunk_size = 1024 * 1024  # 1MB chunks
+    last_log_percent = 0
+    first_chunk = True
+
+    cache_file = open(cache_path, 'wb') if cache_path else None
+    try:
+        with response:
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    break
+
+                if first_chunk:
+                    first_chunk = False
+                    head = chunk.lstrip()[:15]
+                    if head.startswith(b'<!DOCTYPE html') or head.startswith(b'<html'):
+                        LOGGER.error("Download failed - received HTML page instead of data file")
+                        raise RuntimeError("Download failed - received HTML page instead of data file")
+
+                if cache_file is not None:
+                    cache_file.write(chunk)
+                downloaded += len(chunk)
+                if total_size:
+                    progress = (downloaded / total_size) * 100
+                    print(f"\rProgress: {progress:.1f}% ({downloaded / (1024*1024):.2f} MB)", end='', flush=True)
+                    # Log every 10%
+                    if int(progress / 10) > last_log_percent:
+                        last_log_percent = int(progress / 10)
+                        LOGGER.debug(f"Download progress: {progress:.1f}%")
+                else:
+                    print(f"\rDownloaded: {downloaded / (1024*1024):.2f} MB", end='', flush=True)
+
+                yield chunk
+
+        print()  # New line after progress
+    finally:
+        if cache_file is not None:
+            cache_file.close()
+
+    if downloaded == 0:
+        LOGGER.error("Download failed - received no data")
+        raise RuntimeError("Download failed - received no data")
+
+    LOGGER.info(f"Download complete! Received: {downloaded / (1024*1024):.2f} MB")
+
+
+def _relabel_graph(graph):
+    """
+    Remap vertex identifiers to dense int IDs 0..n-1 and return the
+    adjacency as a list of int lists.
+    Integer hashing is effectively free in CPython and list indexing
+    needs no hash probe at all, so the search loops stop hashing byte
+    strings on every visited/adjacency operation and the traversal
+    state can live in flat bytearrays.
+    """
+    id_of = {}
+    adj = []
+
+    def vertex_id(v):
+        i = id_of.get(v)
+        if i is None:
+            i = id_of[v] = len(adj)
+            adj.append([])
+        return i
+
+    for source, destinations in graph.items():
+        row = adj[vertex_id(source)]
+        for dest in destinations:
+            row.append(vertex_id(dest))
+
+    return adj
+
+
+def _tarjan_sccs(adj):
+    """
+    Compute the strongly connected components of an int-labeled
+    adjacency list. Iterative Tarjan (no recursion) so it is safe on
+    long chains.
+    Returns a list of components, each a list of vertex IDs.
+    """
+    n = len(adj)
+    index_of = [-1] * n
+    lowlink = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    sccs = []
+    counter = 0
+
+    for root in range(n):
+        if index_of[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, next_i = work[-1]
+            if next_i == 0:
+                index_of[v] = lowlink[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = 1
+
+            descended = False
+            neighbors = adj[v]
+            for i in range(next_i, len(neighbors)):
+                w = neighbors[i]
+                if index_of[w] == -1:
+                    work[-1] = (v, i + 1)
+                    work.append((w, 0))
+                    descended = True
+                    break
+                elif on_stack[w] and index_of[w] < lowlink[v]:
+                    lowlink[v] = index_of[w]
+            if descended:
+                continue
+
+            if lowlink[v] == index_of[v]:
+                scc = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    scc.append(w)
+                    if w == v:
+                        break
+                sccs.append(scc)
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[v] < lowlink[parent]:
+                    lowlink[parent] = lowlink[v]
+
+    return sccs
+
+
+def _scc_subgraph(adj, scc):
+    """
+    Restrict the adjacency to one SCC, relabeling its vertices to local
+    IDs 0..k-1 (in scc order) so per-component state stays compact.
+    """
+    local = {v: i for i, v in enumerate(scc)}
+    sub = [[] for _ in scc]
+    for i, v in enumerate(scc):
+        row = sub[i]
+        for w in adj[v]:
+            j = local.get(w)
+            if j is not None:
+                row.append(j)
+    return sub
+
+
+def _unblock(v, blocked, block_map):
+    """
+    Johnson's UNBLOCK procedure, iterative via a worklist instead of
+    recursing through the block map.
+    """
+    pending = [v]
+    while pending:
+        u = pending.pop()
+        blocked[u] = 0
+        while block_map[u]:
+            w = block_map[u].pop()
+            if blocked[w]:
+                pending.append(w)
+
+
+def _johnson_longest_cycle(sub):
+    """
+    Find the longest elementary circuit inside one strongly connected
+    component (given as a local-ID adjacency) using Johnson's
+    blocked-set enumeration (Johnson, 1975), keeping only the maximum
+    circuit length instead of materializing every circuit.
+    The blocked set is a flat bytearray, and the circuit search uses an
+    explicit stack of (vertex, neighbor iterator, found flag) frames
+    rather than recursion, so no Python call frames are allocated per
+    edge and long paths cannot overflow the interpreter stack.
+    """
+    k = len(sub)
     longest = 0
-    
-    def dfs(start, current, visited, path_length):
-        nonlocal longest
-        
-        if current not in graph:
-            return
-        
-        for neighbor in graph[current]:
-            if neighbor == start and path_length >= 1:
-                # Found a cycle back to start
-                longest = max(longest, path_length + 1)
-            elif neighbor not in visited:
-                visited.add(neighbor)
-                dfs(start, neighbor, visited, path_length + 1)
-                visited.remove(neighbor)
-    
-    # Try starting from each node
-    for start_node in graph:
-        visited = {start_node}
-        dfs(start_node, start_node, visited, 0)
-    
+
+    for start in range(k):
+        blocked = bytearray(k)
+        blocked[start] = 1
+        block_map = [set() for _ in range(k)]
+
+        # Each frame is [vertex, neighbor iterator, circuit-found flag];
+        # the current path is exactly the vertices on the frame stack.
+        frames = [[start, iter(sub[start]), False]]
+        while frames:
+            frame = frames[-1]
+            v = frame[0]
+            descended = False
+            for w in frame[1]:
+                if w < start:
+                    # Vertex already handled as an earlier start; treat as removed
+                    continue
+                if w == start:
+                    if len(frames) >= 2:
+                        longest = max(longest, len(frames))
+                    frame[2] = True
+                elif not blocked[w]:
+                    blocked[w] = 1
+                    frames.append([w, iter(sub[w]), False])
+                    descended = True
+                    break
+            if descended:
+                continue
+
+            # Neighbors exhausted: pop the frame and propagate the flag
+            frames.pop()
+            if frame[2]:
+                _unblock(v, blocked, block_map)
+                if frames:
+                    frames[-1][2] = True
+            else:
+                for w in sub[v]:
+                    if w >= start:
+                        block_map[w].add(v)
+
     return longest
 
 
-def process_file(filepath):
+# SCCs up to this many vertices are searched with int-bitmask adjacency
+# and visited state: one word covers the whole component, set algebra
+# collapses to single &/|/~ operations, and (vertex, visited_mask)
+# subproblems can be memoized
+_SMALL_SCC_LIMIT = 64
+
+# A subproblem is cached only once its subtree cost at least this many
+# expansions; caching every tiny subtree would thrash the table
+_MEMO_WORK_THRESHOLD = 64
+
+
+def _reach_masks(adj_mask):
+    """
+    Per-vertex reachability bitmasks (transitive closure) for a small
+    SCC given as neighborhood bitmasks: bit w of reach[v] is set when w
+    is reachable from v through one or more edges. Computed by
+    OR-propagation to a fixpoint, which is plenty for components under
+    the small-SCC limit.
+    """
+    k = len(adj_mask)
+    reach = list(adj_mask)
+
+    changed = True
+    while changed:
+        changed = False
+        for v in range(k):
+            mask = reach[v]
+            merged = mask
+            remaining = mask
+            while remaining:
+                low = remaining & -remaining
+                merged |= reach[low.bit_length() - 1]
+                remaining ^= low
+            if merged != mask:
+                reach[v] = merged
+                changed = True
+    return reach
+
+
+def _bitmask_longest_cycle(sub, lower_bound=0):
+    """
+    Longest-cycle search for small SCCs, with both the adjacency and
+    the visited set packed into int bitmasks, repeated subproblems
+    memoized and branches pruned against the best length known so far.
+    The unvisited-neighbor set of a vertex is one '& ~mask' away and
+    candidates are peeled off with lowest-bit extraction, so no
+    per-neighbor list iteration or membership test remains; whether an
+    edge closes back to the start is a single bit test on adj_mask.
+    search(v, mask) returns the longest path from v back to start that
+    avoids the vertices in mask; since mask fixes both the remaining
+    vertex set and the current path length (its popcount), the value
+    depends only on (v, mask) and can be cached. Two cutoffs run per
+    recursion, each a single popcount/bit test on precomputed
+    reachability masks: a branch dies when the start vertex is no
+    longer reachable, or when the path plus every vertex still
+    reachable cannot beat the current bound. The memo is cleared per
+    start vertex (the target changes), and only subproblems whose
+    subtree exceeded a work threshold are stored. Recursion depth is
+    bounded by _SMALL_SCC_LIMIT, so the interpreter stack is safe.
+    """
+    k = len(sub)
+    adj_mask = [0] * k
+    for v, row in enumerate(sub):
+        mask = 0
+        for w in row:
+            mask |= 1 << w
+        adj_mask[v] = mask
+    reach = _reach_masks(adj_mask)
+    longest = 0
+    bound = lower_bound
+
+    for start in range(k):
+        memo = {}
+        start_bit = 1 << start
+        # Vertices below the current start are treated as removed
+        allowed = -1 << start
+
+        def search(v, mask):
+            reachable = reach[v]
+            if not reachable & start_bit:
+                # The start can never be reached again from here
+                return -1, 1
+            if mask.bit_count() + (reachable & ~mask & allowed).bit_count() <= bound:
+                # Even visiting every reachable vertex cannot beat the
+                # best cycle already known
+                return -1, 1
+            cached = memo.get((v, mask))
+            if cached is not None:
+                return cached, 0
+            # An edge back to the start closes a cycle of length 1 from here
+            best = 1 if adj_mask[v] & start_bit else -1
+            work = 1
+            candidates = adj_mask[v] & allowed & ~mask
+            while candidates:
+                low = candidates & -candidates
+                candidates ^= low
+                sub_best, sub_work = search(low.bit_length() - 1, mask | low)
+                work += sub_work
+                if sub_best >= 1 and sub_best + 1 > best:
+                    best = sub_best + 1
+            if work >= _MEMO_WORK_THRESHOLD:
+                memo[(v, mask)] = best
+            return best, work
+
+        best, _ = search(start, start_bit)
+        # best == 1 would be a self-loop, which is not a routing cycle
+        if best >= 2 and best > longest:
+            longest = best
+            if longest > bound:
+                bound = longest
+
+    return longest
+
+
+if _njit is not None:
+
+    @_njit(cache=True)
+    def _longest_cycle_csr(indptr, indices, n):
+        """
+        Compiled iterative DFS over a CSR adjacency (indptr/indices int32
+        arrays) for one SCC of n vertices. Starts are taken in ascending
+        vertex order and only vertices >= start may appear on the path,
+        so each elementary cycle is enumerated exactly once, from its
+        lowest-numbered vertex.
+        """
+        longest = 0
+        path = _np.empty(n, _np.int32)
+        cursor = _np.empty(n, _np.int32)
+        on_path = _np.zeros(n, _np.bool_)
+        for start in range(n):
+            depth = 0
+            path[0] = start
+            cursor[0] = indptr[start]
+            on_path[start] = True
+            while depth >= 0:
+                v = path[depth]
+                i = cursor[depth]
+                if i < indptr[v + 1]:
+                    cursor[depth] = i + 1
+                    w = indices[i]
+                    if w < start:
+                        continue
+                    if w == start:
+                        if depth >= 1 and depth + 1 > longest:
+                            longest = depth + 1
+                    elif not on_path[w]:
+                        depth += 1
+                        path[depth] = w
+                        cursor[depth] = indptr[w]
+                        on_path[w] = True
+                else:
+                    on_path[v] = False
+                    depth -= 1
+        return longest
+
+
+def _csr_longest_cycle(sub):
+    """
+    Numba-accelerated variant of the per-SCC cycle search: pack the
+    component's local-ID adjacency into CSR arrays and hand them to
+    the compiled kernel.
+    """
+    n = len(sub)
+    indptr = _np.empty(n + 1, _np.int32)
+    indptr[0] = 0
+    flat_indices = []
+    for i, row in enumerate(sub):
+        flat_indices.extend(row)
+        indptr[i + 1] = len(flat_indices)
+    indices = _np.array(flat_indices, dtype=_np.int32)
+    return int(_longest_cycle_csr(indptr, indices, n))
+
+
+def _ext_longest_cycle(sub):
+    """
+    C-extension variant of the per-SCC cycle search: pack the
+    component's local-ID adjacency into CSR array('i') buffers (the
+    extension takes any int buffer, so NumPy is not needed) and call
+    the compiled kernel.
+    """
+    n = len(sub)
+    indptr = array('i', bytes(4 * (n + 1)))
+    flat_indices = array('i')
+    for i, row in enumerate(sub):
+        flat_indices.extend(row)
+        indptr[i + 1] = len(flat_indices)
+    return _c_longest_cycle(indptr, flat_indices, n)
+
+
+def _max_cycle_in_scc(adj, scc, lower_bound=0):
+    """
+    Longest cycle inside one non-trivial SCC. Small components use the
+    memoized bitmask search (which also prunes against lower_bound);
+    larger ones dispatch to the C extension when built, then to the
+    Numba CSR kernel when available, then to the pure-Python Johnson
+    enumeration.
+    """
+    sub = _scc_subgraph(adj, scc)
+    if len(sub) <= _SMALL_SCC_LIMIT:
+        return _bitmask_longest_cycle(sub, lower_bound)
+    if _c_longest_cycle is not None:
+        return _ext_longest_cycle(sub)
+    if _njit is not None:
+        return _csr_longest_cycle(sub)
+    return _johnson_longest_cycle(sub)
+
+
+def find_longest_cycle_in_graph(graph, lower_bound=0):
+    """
+    Find the longest simple cycle in a directed graph.
+    Relabels vertices to dense int IDs, decomposes the graph into
+    strongly connected components, then searches for the longest cycle
+    inside each non-trivial component.
+    Components of at most lower_bound vertices are skipped, since a
+    simple cycle can never be longer than its component; callers that
+    already hold a best-so-far length use this to prune whole searches.
+    Returns the length of the longest cycle found (0 if none beats the
+    bound).
+    """
+    adj = _relabel_graph(graph)
+    longest = 0
+
+    for scc in _tarjan_sccs(adj):
+        if len(scc) < 2 or len(scc) <= lower_bound:
+            # A single vertex cannot form a simple cycle (self-loops
+            # are not counted as routing cycles), and a component no
+            # larger than the bound cannot improve on it
+            continue
+        longest = max(longest, _max_cycle_in_scc(adj, scc, max(longest, lower_bound)))
+
+    return longest
+
+
+def _read_chunks(fd):
+    """Yield 1 MB byte chunks from a file descriptor until EOF."""
+    while True:
+        buf = os.read(fd, 1 << 20)
+        if not buf:
+            return
+        yield buf
+
+
+def _iter_lines(chunks):
+    """
+    Split an iterable of byte chunks into lines, carrying the partial
+    last line of each chunk over to the next one.
+    """
+    leftover = b''
+    for buf in chunks:
+        if leftover:
+            buf = leftover + buf
+        last_newline = buf.rfind(b'\n')
+        if last_newline == -1:
+            leftover = buf
+            continue
+        leftover = buf[last_newline + 1:]
+        yield from buf[:last_newline].split(b'\n')
+    if leftover:
+        # Final line without a trailing newline
+        yield leftover
+
+
+def process_chunks(chunks):
     """
-    Stream the file and build graphs per (claim_id, status_code).
-    Returns dictionary mapping (claim_id, status_code) -> graph
+    Parse an iterable of raw byte chunks and yield (key, graph) pairs,
+    one per (claim_id, status_code) combination.
+    The bytes are piped through the system sort(1) keyed on the
+    claim_id and status_code fields, so all records of one graph arrive
+    contiguously and each graph can be built, handed downstream and
+    freed before the next one is assembled: memory stays proportional
+    to the largest single graph (plus the identifier interner) instead
+    of the whole edge set, and sort(1) spills to its own temp files for
+    inputs bigger than RAM. A background thread feeds sort's stdin
+    while the sorted stream is consumed, so for downloads the network
+    transfer overlaps with sorting. Lines are split on b'\\n' and b'|'
+    at the byte level; identifiers stay as bytes and are interned
+    through a dict so each distinct value is allocated once. When
+    sort(1) is unavailable the edges are sorted in memory instead. The
+    reporting layer decodes the winning claim_id/status_code at the
+    very end.
     """
     global LOGGER
-    
-    # Dictionary: (claim_id, status_code) -> {source -> [destinations]}
-    graphs = defaultdict(lambda: defaultdict(list))
+
     line_count = 0
     valid_lines = 0
-    
-    LOGGER.info(f"Processing file: {filepath}")
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
+    group_count = 0
+
+    # Dict-based interner: maps each identifier to its first allocation
+    interned = {}
+    intern = interned.setdefault
+
+    def parse_records(lines):
+        nonlocal line_count, valid_lines
+        for line in lines:
             line_count += 1
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split('|')
+
+            parts = line.strip().split(b'|')
             if len(parts) != 4:
                 continue
-            
+
             valid_lines += 1
             source, dest, claim_id, status_code = parts
-            key = (claim_id, status_code)
-            graphs[key][source].append(dest)
-            
+            yield (
+                intern(claim_id, claim_id),
+                intern(status_code, status_code),
+                intern(source, source),
+                intern(dest, dest),
+            )
+
             # Log progress every 1 million lines
             if line_count % 1000000 == 0:
                 LOGGER.debug(f"Processed {line_count:,} lines...")
-    
+
+    proc = None
+    feeder = None
+    # Exceptions raised in the feeder thread land here; they are
+    # re-raised on the consuming side once the sorted stream ends
+    feed_error = []
+    try:
+        try:
+            # LC_ALL=C makes sort(1) compare raw bytes, matching the
+            # byte-level grouping below
+            proc = subprocess.Popen(
+                ['sort', '-t', '|', '-k3,3', '-k4,4'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                env=dict(os.environ, LC_ALL='C'),
+            )
+        except OSError:
+            proc = None
+
+        if proc is not None:
+            def feed():
+                try:
+                    for buf in chunks:
+                        proc.stdin.write(buf)
+                except BrokenPipeError:
+                    pass
+                except BaseException as e:
+                    feed_error.append(e)
+                finally:
+                    try:
+                        proc.stdin.close()
+                    except BrokenPipeError:
+                        pass
+
+            feeder = threading.Thread(target=feed, daemon=True)
+            feeder.start()
+            records = parse_records(_iter_lines(_read_chunks(proc.stdout.fileno())))
+        else:
+            LOGGER.debug("sort(1) unavailable, falling back to in-memory sort")
+            records = sorted(
+                parse_records(_iter_lines(chunks)),
+                key=itemgetter(0, 1),
+            )
+
+        current_key = None
+        graph = None
+        for claim_id, status_code, source, dest in records:
+            key = (claim_id, status_code)
+            if key != current_key:
+                if current_key is not None:
+                    group_count += 1
+                    yield current_key, graph
+                current_key = key
+                graph = defaultdict(list)
+            graph[source].append(dest)
+
+        # A failed chunk source or a killed sort would otherwise look
+        # like a successfully processed (truncated) input, so surface
+        # those failures before emitting the final group
+        if feeder is not None:
+            feeder.join()
+            if feed_error:
+                raise feed_error[0]
+        if proc is not None:
+            proc.stdout.close()
+            if proc.wait() != 0:
+                LOGGER.error(f"sort(1) exited with status {proc.returncode}")
+                raise RuntimeError(f"sort(1) exited with status {proc.returncode}")
+
+        if current_key is not None:
+            group_count += 1
+            yield current_key, graph
+    finally:
+        if proc is not None:
+            proc.stdout.close()
+            proc.wait()
+        if feeder is not None:
+            feeder.join()
+
     LOGGER.info(f"File processing complete: {line_count:,} total lines, {valid_lines:,} valid entries")
-    LOGGER.info(f"Found {len(graphs)} unique (claim_id, status_code) combinations")
-    
-    return graphs
+    LOGGER.info(f"Found {group_count} unique (claim_id, status_code) combinations")
 
 
-def find_longest_routing_cycle(filepath):
+def process_file(filepath):
     """
-    Main function to find the longest routing cycle.
+    Parse a local file and yield (key, graph) pairs: reads the file
+    with os.read in 1 MB slabs (with a sequential-readahead hint) and
+    delegates sorting and grouping to process_chunks.
+    """
+    global LOGGER
+
+    LOGGER.info(f"Processing file: {filepath}")
+
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            # Tell the kernel this is a straight sequential scan so it
+            # can read ahead aggressively
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        yield from process_chunks(_read_chunks(fd))
+    finally:
+        os.close(fd)
+
+
+def _cycle_search_worker(task):
+    """
+    Process-pool worker: search one (claim_id, status_code) graph.
+    Self-contained (graph and bound travel with the task) so workers
+    need no shared state. Returns (key, cycle_length).
+    """
+    key, graph, lower_bound = task
+    return key, find_longest_cycle_in_graph(graph, lower_bound)
+
+
+def find_longest_routing_cycle(filepath=None, chunks=None):
+    """
+    Main function to find the longest routing cycle, reading either a
+    local file (filepath) or an iterable of raw byte chunks (chunks,
+    e.g. a download streamed straight off the network).
+    Each (claim_id, status_code) graph is independent, so the searches
+    are fanned out over a process pool; batches are submitted with the
+    current best length as lower bound, so later batches still benefit
+    from branch-and-bound pruning.
     Returns (claim_id, status_code, cycle_length)
     """
     global LOGGER
-    
-    graphs = process_file(filepath)
-    
+
+    if chunks is not None:
+        graph_stream = process_chunks(chunks)
+    else:
+        graph_stream = process_file(filepath)
+
     best_claim_id = None
     best_status_code = None
     best_length = 0
     graphs_processed = 0
-    
-    LOGGER.info("Searching for longest routing cycle...")
-    
-    for (claim_id, status_code), graph in graphs.items():
-        cycle_length = find_longest_cycle_in_graph(dict(graph))
+
+    max_workers = os.cpu_count() or 1
+    # One batch per pruning round; large enough to keep every worker busy
+    batch_size = max_workers * 256
+
+    LOGGER.info(f"Searching for longest routing cycle ({max_workers} workers)...")
+
+    def handle_result(key, cycle_length):
+        nonlocal best_claim_id, best_status_code, best_length, graphs_processed
         graphs_processed += 1
-        
         if cycle_length > best_length:
             best_length = cycle_length
-            best_claim_id = claim_id
-            best_status_code = status_code
-            LOGGER.debug(f"New best cycle found: claim_id={claim_id}, status_code={status_code}, length={cycle_length}")
-        
+            best_claim_id, best_status_code = key
+            LOGGER.debug(f"New best cycle found: claim_id={key[0]}, status_code={key[1]}, length={cycle_length}")
         # Log progress every 10000 graphs
         if graphs_processed % 10000 == 0:
             LOGGER.debug(f"Analyzed {graphs_processed:,} graphs...")
-    
+
+    def edge_count(item):
+        return sum(len(dests) for dests in item[1].values())
+
+    first_batch = list(islice(graph_stream, batch_size))
+    # Branch-and-bound ordering heuristic: searching the biggest graphs
+    # of a batch first tends to find a long cycle early, so the bound
+    # prunes more of the remaining (smaller) graphs. The stream arrives
+    # in key order and buffering it whole would defeat the streaming
+    # ingest, so the ordering is applied per batch.
+    first_batch.sort(key=edge_count, reverse=True)
+
+    if max_workers == 1 or len(first_batch) <= max_workers * 4:
+        # Pool startup only costs milliseconds, so serial is only worth
+        # it for a handful of graphs per worker
+        for key, graph in first_batch:
+            handle_result(key, find_longest_cycle_in_graph(graph, best_length))
+        for key, graph in graph_stream:
+            handle_result(key, find_longest_cycle_in_graph(graph, best_length))
+    else:
+        # Processes rather than threads: the C extension kernel does
+        # release the GIL, but it only handles SCCs too big for the
+        # bitmask search, and Tarjan, relabeling and the small-SCC path
+        # are pure Python and would serialize under a thread pool
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            batch = first_batch
+            while batch:
+                tasks = [(key, dict(graph), best_length) for key, graph in batch]
+                chunksize = max(1, len(tasks) // (4 * max_workers))
+                for key, cycle_length in executor.map(_cycle_search_worker, tasks, chunksize=chunksize):
+                    handle_result(key, cycle_length)
+                batch = list(islice(graph_stream, batch_size))
+                batch.sort(key=edge_count, reverse=True)
+
     LOGGER.info(f"Cycle search complete: analyzed {graphs_processed:,} graphs")
-    
+
+    # Identifiers are carried as bytes through parsing and search;
+    # decode only the winning pair for reporting
+    if best_claim_id is not None:
+        best_claim_id = best_claim_id.decode('utf-8')
+        best_status_code = best_status_code.decode('utf-8')
+
     if best_claim_id:
         LOGGER.info(f"Longest cycle found: claim_id={best_claim_id}, status_code={best_status_code}, length={best_length}")
     else:
@@ -376,6 +985,11 @@ def main():
         action="store_true",
         help="Skip download and use existing file in data folder"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Also write the streamed download to the data folder (for later --skip-download runs)"
+    )
     
     args = parser.parse_args()
     
@@ -426,12 +1040,24 @@ def main():
                 LOGGER.error(f"No existing file found at: {existing_file}")
                 raise FileNotFoundError(f"No existing file at {existing_file}. Remove --skip-download to download.")
         else:
-            filepath, filename = download_file(args.data_url, args.dest_folder)
-        
+            # Stream the download straight into the parser: no disk
+            # round-trip unless --cache asks for a copy
+            filepath = None
+            response, filename = open_download_stream(args.data_url)
+            cache_path = None
+            if args.cache:
+                os.makedirs(args.dest_folder, exist_ok=True)
+                cache_path = os.path.join(args.dest_folder, filename)
+                LOGGER.info(f"Caching download to: {cache_path}")
+            chunks = iter_download_chunks(response, cache_path)
+
         # Process the downloaded file
         LOGGER.info("")
         LOGGER.info("=== Phase 2: Processing Data ===")
-        claim_id, status_code, cycle_length = find_longest_routing_cycle(filepath)
+        if filepath is not None:
+            claim_id, status_code, cycle_length = find_longest_routing_cycle(filepath)
+        else:
+            claim_id, status_code, cycle_length = find_longest_routing_cycle(chunks=chunks)
         
         if claim_id is not None:
             LOGGER.info("")
@@ -0,0 +1,17 @@
+"""
+Optional build script for the _cycle C extension.
+
+The Routing Cycle Detector runs fine on the standard library alone;
+building the extension only speeds up the per-SCC cycle search:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="routing-cycle-detector",
+    ext_modules=cythonize("_cycle.pyx"),
+)